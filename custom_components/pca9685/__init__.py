@@ -1,18 +1,22 @@
 """The pca9685 PWM component."""
 
 import logging
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 
 from .const import (
     CONF_ADDR,
     CONF_BUS,
     CONF_FREQUENCY,
+    CONST_RELOAD_COOLDOWN,
     DEFAULT_I2C_LOCKS_KEY,
     DOMAIN,
     PCA9685_DRIVERS,
+    PCA9685_RELOAD_DEBOUNCERS,
 )
 from .i2c_lock import get_i2c_bus_lock
 from .pca_driver import PCA9685Driver
@@ -26,39 +30,63 @@ I2C_LOCKS_KEY = DEFAULT_I2C_LOCKS_KEY
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PCA9685 from a config entry."""
     # Create PCA driver for this platform
-
-    bus = entry.data[CONF_BUS]
-
-
     pca_driver = PCA9685Driver(
-        i2c_bus=bus,
+        i2c_bus=entry.data[CONF_BUS],
         address=int(entry.data[CONF_ADDR]),
     )
-    
+
     busnr = pca_driver.busnr
     device_lock, created = get_i2c_bus_lock(hass, I2C_LOCKS_KEY, busnr)
     if created:
-        _LOGGER.warning("PCA9685 Created new lock for I2C bus %s", busnr)
+        _LOGGER.debug("PCA9685 Created new lock for I2C bus %s", busnr)
     await pca_driver.init_async(hass=hass, device_lock=device_lock)
-    await pca_driver.set_pwm_frequency(entry.data[CONF_FREQUENCY])
 
     pca9685_data = hass.data.setdefault(DOMAIN, {})
-    if PCA9685_DRIVERS not in pca9685_data:
-        pca9685_data[PCA9685_DRIVERS] = {}
+    # Program the chip before any platform is set up, so a failing device
+    # aborts the setup without leaving entities behind.
+    await _async_program_frequency(pca_driver, entry.data[CONF_FREQUENCY])
     # TODO@domectrl: check bus & address used in another driver?  # noqa: FIX002, TD003
-    pca9685_data[PCA9685_DRIVERS][entry.entry_id] = pca_driver
+    pca9685_data.setdefault(PCA9685_DRIVERS, {})[entry.entry_id] = pca_driver
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Coalesce bursts of entry updates (e.g. adding several entities) into
+    # a single reload.
+    reload_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=CONST_RELOAD_COOLDOWN,
+        immediate=False,
+        function=partial(hass.config_entries.async_reload, entry.entry_id),
+    )
+    pca9685_data.setdefault(PCA9685_RELOAD_DEBOUNCERS, {})[entry.entry_id] = (
+        reload_debouncer
+    )
+    entry.async_on_unload(reload_debouncer.async_shutdown)
     entry.async_on_unload(entry.add_update_listener(config_entry_update_listener))
     return True
 
 
+async def _async_program_frequency(pca_driver: PCA9685Driver, frequency: int) -> None:
+    """Program the PWM frequency, unless the chip already runs at it."""
+    # Ask the device itself, it may have been power cycled since the last setup
+    if not await pca_driver.runs_at_pwm_frequency(frequency):
+        await pca_driver.set_pwm_frequency(frequency)
+
+
 async def config_entry_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener, called when the config entry options are changed."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    await hass.data[DOMAIN][PCA9685_RELOAD_DEBOUNCERS][entry.entry_id].async_call()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        # Dropping the driver also releases the bus lock once no other
+        # driver on that bus holds it.
+        hass.data[DOMAIN][PCA9685_RELOAD_DEBOUNCERS].pop(entry.entry_id, None)
+        pca_driver = hass.data[DOMAIN][PCA9685_DRIVERS].pop(entry.entry_id, None)
+        if pca_driver is not None:
+            await pca_driver.close_async()
+    return unload_ok
@@ -1,15 +1,14 @@
 """Config flow definition for PCA9685."""
 
+import functools
+import itertools
 import logging
-from pathlib import Path
-from typing import Any, ClassVar
+import os
+import time
+from collections.abc import Callable
+from typing import Any
 
 import voluptuous as vol
-from homeassistant.components.number import (
-    DEFAULT_MAX_VALUE,
-    DEFAULT_MIN_VALUE,
-    DEFAULT_STEP,
-)
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -26,6 +25,7 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import callback
+from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.helpers import selector
 
 from .const import (
@@ -43,6 +43,7 @@ from .const import (
     CONF_STEP,
     CONST_ADDR_MAX,
     CONST_ADDR_MIN,
+    CONST_I2C_BUS_CACHE_TTL,
     CONST_PWM_FREQ_MAX,
     CONST_PWM_FREQ_MIN,
     CONST_RGB_LED_PINS,
@@ -50,19 +51,155 @@ from .const import (
     CONST_SIMPLE_LED_PINS,
     DEFAULT_ADDR,
     DEFAULT_FREQ,
+    DEFAULT_NUMBER_MAX,
+    DEFAULT_NUMBER_MIN,
+    DEFAULT_NUMBER_STEP,
     DOMAIN,
     MODE_AUTO,
     MODE_BOX,
     MODE_SLIDER,
+    PCA9685_I2C_BUSSES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _list_i2c_buses() -> list[str]:
+    """List the I2C bus device nodes available in /dev."""
+    with os.scandir("/dev") as entries:
+        return sorted(
+            f"/dev/{entry.name}" for entry in entries if entry.name.startswith("i2c-")
+        )
+
+
+@functools.lru_cache(maxsize=4)
+def _bus_schema(i2c_busses: tuple[str, ...]) -> vol.Schema:
+    """Generate the schema for configuring a PCA9685 on one of the given busses."""
+    i2c_bus_selector = [
+        selector.SelectOptionDict(value=bus, label=bus) for bus in i2c_busses
+    ]
+    # find out what adresses on this bus are already in use.
+    # Set default to first not-used adress
+
+    return vol.Schema(
+        {
+            vol.Optional(CONF_BUS, default=i2c_busses[0]): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=i2c_bus_selector),
+            ),
+            vol.Optional(CONF_ADDR, default=DEFAULT_ADDR): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=CONST_ADDR_MIN,
+                    max=CONST_ADDR_MAX,
+                    mode=selector.NumberSelectorMode.BOX,
+                    step=1,
+                ),
+            ),
+            vol.Optional(CONF_FREQUENCY, default=DEFAULT_FREQ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=CONST_PWM_FREQ_MIN,
+                    max=CONST_PWM_FREQ_MAX,
+                    mode=selector.NumberSelectorMode.BOX,
+                    step=1,
+                ),
+            ),
+        }
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _pin_option(pin: str) -> selector.SelectOptionDict:
+    """Return the shared select option for a pin."""
+    return selector.SelectOptionDict(value=pin, label=pin)
+
+
+_MODE_OPTIONS = [
+    selector.SelectOptionDict(value=mode, label=mode)
+    for mode in (MODE_BOX, MODE_SLIDER, MODE_AUTO)
+]
+
+
+# Selectors are not modified after construction, so fields can share them
+_TEXT_SELECTOR = selector.TextSelector()
+_BOOL_SELECTOR = selector.BooleanSelector()
+_NUMBER_BOX_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(mode=selector.NumberSelectorMode.BOX)
+)
+_STEP_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, mode=selector.NumberSelectorMode.BOX)
+)
+_MODE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=_MODE_OPTIONS)
+)
+
+# Number specific fields; these do not depend on the free pins
+_NUMBER_SCHEMA_EXTENSION = {
+    vol.Optional(CONF_INVERT, default=False): _BOOL_SELECTOR,
+    vol.Optional(CONF_MINIMUM, default=DEFAULT_NUMBER_MIN): _NUMBER_BOX_SELECTOR,
+    vol.Optional(CONF_MAXIMUM, default=DEFAULT_NUMBER_MAX): _NUMBER_BOX_SELECTOR,
+    vol.Optional(
+        CONF_NORMALIZE_LOWER, default=DEFAULT_NUMBER_MIN
+    ): _NUMBER_BOX_SELECTOR,
+    vol.Optional(
+        CONF_NORMALIZE_UPPER, default=DEFAULT_NUMBER_MAX
+    ): _NUMBER_BOX_SELECTOR,
+    vol.Optional(CONF_STEP, default=DEFAULT_NUMBER_STEP): _STEP_SELECTOR,
+    vol.Optional(CONF_MODE, default=MODE_SLIDER): _MODE_SELECTOR,
+}
+
+# One bit per PCA9685 output
+_ALL_PINS_MASK = 0xFFFF
+_ALL_PINS = tuple(str(pin) for pin in range(16))
+# Subentry data keys that hold a pin number
+_PIN_KEYS = (CONF_PIN, CONF_PIN_RED, CONF_PIN_GREEN, CONF_PIN_BLUE, CONF_PIN_WHITE)
+_COLOR_PIN_KEYS = (CONF_PIN_RED, CONF_PIN_GREEN, CONF_PIN_BLUE, CONF_PIN_WHITE)
+_PIN_COLORS = dict(zip(_COLOR_PIN_KEYS, ("red", "green", "blue", "white"), strict=True))
+# Error for (first, later) color pin keys sharing the same pin
+_PIN_CONFLICT_ERRORS = {
+    (first, later): (
+        f"{_PIN_COLORS[later].capitalize()} light uses same pin number as "
+        f"{_PIN_COLORS[first]} light!"
+    )
+    for first, later in itertools.combinations(_COLOR_PIN_KEYS, 2)
+}
+
+
+def _per_free_pins[T](
+    build: Callable[["PCA9685LedSubentryFlowHandler"], T],
+) -> Callable[["PCA9685LedSubentryFlowHandler"], T]:
+    """Cache the result of a schema builder for the current set of free pins."""
+
+    @functools.wraps(build)
+    def wrapper(self: "PCA9685LedSubentryFlowHandler") -> T:
+        key = (build.__name__, self._pin_mask)
+        if (result := self._schema_cache.get(key)) is None:
+            result = self._schema_cache[key] = build(self)
+        return result
+
+    return wrapper
+
+
 class PCA9685LedSubentryFlowHandler(ConfigSubentryFlow):
     """Handle subentry flow for adding entities."""
 
-    _pins: ClassVar[list[str]] = [str(i) for i in range(16)]
+    def __init__(self) -> None:
+        """Initialize the subentry flow with its own set of free pins."""
+        super().__init__()
+        self._pin_mask: int = _ALL_PINS_MASK
+        self._schema_cache: dict[tuple[str, int], Any] = {}
+
+    @property
+    @_per_free_pins
+    def _pins(self) -> list[str]:
+        """Return the free pins, lowest first."""
+        return [pin for i, pin in enumerate(_ALL_PINS) if self._pin_mask & (1 << i)]
+
+    def _lowest_free_pin(self) -> str:
+        """Return the lowest free pin."""
+        return str((self._pin_mask & -self._pin_mask).bit_length() - 1)
+
+    def _release_pin(self, pin: str) -> None:
+        """Mark a pin as free to use."""
+        self._pin_mask |= 1 << int(pin)
 
     async def async_step_user(
         self,
@@ -70,186 +207,98 @@ class PCA9685LedSubentryFlowHandler(ConfigSubentryFlow):
     ) -> SubentryFlowResult:
         """User flow to add a new entities."""
         self._update_free_pins()
+        free_pins = self._pin_mask.bit_count()
 
-        if len(self._pins) == 0:
+        if not free_pins:
             return self.async_abort(reason="All pins are configured.")
 
         options = {}
-        if len(self._pins) >= CONST_SIMPLE_LED_PINS:
+        if free_pins >= CONST_SIMPLE_LED_PINS:
             options["simple_light"] = "Simple light"
             options["number"] = "Number"
-        if len(self._pins) >= CONST_RGB_LED_PINS:
+        if free_pins >= CONST_RGB_LED_PINS:
             options["rgb_light"] = "RGB Light"
-        if len(self._pins) >= CONST_RGBW_LED_PINS:
+        if free_pins >= CONST_RGBW_LED_PINS:
             options["rgbw_light"] = "RGBW Light"
         return self.async_show_menu(menu_options=options)
 
+    @_per_free_pins
+    def _pin_selector(self) -> selector.SelectSelector:
+        """Return a pin selector for the free pins, shared by all pin fields."""
+        return selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[_pin_option(pin) for pin in self._pins],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        )
+
+    @_per_free_pins
     def _generate_schema_simple_light(self) -> vol.Schema:
         """Generate schema for simple light."""
-        pin_selector = [
-            selector.SelectOptionDict(value=str(pin), label=str(pin))
-            for pin in self._pins
-        ]
         return vol.Schema(
             {
-                vol.Required(CONF_NAME): selector.TextSelector(),
+                vol.Required(CONF_NAME): _TEXT_SELECTOR,
                 vol.Required(
-                    CONF_PIN, default=str(self._pins[0])
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=pin_selector, mode=selector.SelectSelectorMode.DROPDOWN
-                    ),
-                ),
+                    CONF_PIN, default=self._lowest_free_pin()
+                ): self._pin_selector(),
             }
         )
 
+    @_per_free_pins
     def _generate_schema_number(self) -> vol.Schema:
         """Generate schema for number config."""
-        return self._generate_schema_simple_light().extend(
-            {
-                vol.Optional(CONF_INVERT, default=False): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_MINIMUM, default=DEFAULT_MIN_VALUE
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(mode=selector.NumberSelectorMode.BOX)
-                ),
-                vol.Optional(
-                    CONF_MAXIMUM, default=DEFAULT_MAX_VALUE
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(mode=selector.NumberSelectorMode.BOX)
-                ),
-                vol.Optional(
-                    CONF_NORMALIZE_LOWER, default=DEFAULT_MIN_VALUE
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(mode=selector.NumberSelectorMode.BOX)
-                ),
-                vol.Optional(
-                    CONF_NORMALIZE_UPPER, default=DEFAULT_MAX_VALUE
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(mode=selector.NumberSelectorMode.BOX)
-                ),
-                vol.Optional(CONF_STEP, default=DEFAULT_STEP): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Optional(CONF_MODE, default=MODE_SLIDER): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            selector.SelectOptionDict(value=MODE_BOX, label=MODE_BOX),
-                            selector.SelectOptionDict(
-                                value=MODE_SLIDER, label=MODE_SLIDER
-                            ),
-                            selector.SelectOptionDict(value=MODE_AUTO, label=MODE_AUTO),
-                        ]
-                    )
-                ),
-            }
-        )
+        return self._generate_schema_simple_light().extend(_NUMBER_SCHEMA_EXTENSION)
 
+    @_per_free_pins
     def _generate_schema_rgb_light(self) -> vol.Schema:
         """Generate schema for RGB light."""
-        pin_selector = [
-            selector.SelectOptionDict(value=str(pin), label=str(pin))
-            for pin in self._pins
-        ]
+        pins = self._pins
+        pin_selector = self._pin_selector()
         return vol.Schema(
             {
-                vol.Required(CONF_NAME): selector.TextSelector(),
-                vol.Required(
-                    CONF_PIN_RED, default=str(self._pins[0])
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=pin_selector, mode=selector.SelectSelectorMode.DROPDOWN
-                    ),
-                ),
-                vol.Required(
-                    CONF_PIN_GREEN, default=str(self._pins[1])
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=pin_selector, mode=selector.SelectSelectorMode.DROPDOWN
-                    ),
-                ),
-                vol.Required(
-                    CONF_PIN_BLUE, default=str(self._pins[2])
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=pin_selector, mode=selector.SelectSelectorMode.DROPDOWN
-                    ),
-                ),
+                vol.Required(CONF_NAME): _TEXT_SELECTOR,
+                vol.Required(CONF_PIN_RED, default=pins[0]): pin_selector,
+                vol.Required(CONF_PIN_GREEN, default=pins[1]): pin_selector,
+                vol.Required(CONF_PIN_BLUE, default=pins[2]): pin_selector,
             }
         )
 
+    @_per_free_pins
     def _generate_schema_rgbw_light(self) -> vol.Schema:
         """Generate schema for RGBW light."""
-        pin_selector = [
-            selector.SelectOptionDict(value=str(pin), label=str(pin))
-            for pin in self._pins
-        ]
         return self._generate_schema_rgb_light().extend(
-            {
-                vol.Required(
-                    CONF_PIN_WHITE, default=str(self._pins[3])
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=pin_selector, mode=selector.SelectSelectorMode.DROPDOWN
-                    ),
-                )
-            }
+            {vol.Required(CONF_PIN_WHITE, default=self._pins[3]): self._pin_selector()}
         )
 
     def _update_free_pins(self) -> None:
-        """Update list of pins that are free to use."""
-        self._pins.clear()
-        self._pins.extend([str(i) for i in range(16)])
-        for pca in self.hass.config_entries.async_entries(DOMAIN):
-            if pca.subentries and pca.entry_id == self.handler[0]:  # It's my parent PCA
-                for entry in pca.subentries:
-                    for pin in [
-                        CONF_PIN,
-                        CONF_PIN_RED,
-                        CONF_PIN_GREEN,
-                        CONF_PIN_BLUE,
-                        CONF_PIN_WHITE,
-                    ]:
-                        if pca.subentries[entry].data.get(pin) is not None:
-                            self._pins.remove(pca.subentries[entry].data[pin])
+        """Update the set of pins that are free to use."""
+        self._schema_cache.clear()
+        used = 0
+        if pca := self.hass.config_entries.async_get_entry(self.handler[0]):
+            for subentry in pca.subentries.values():
+                for key in _PIN_KEYS:
+                    if (pin := subentry.data.get(key)) is not None:
+                        used |= 1 << int(pin)
+        self._pin_mask = _ALL_PINS_MASK & ~used
 
     def _check_pin_conflicts(self, user_input: dict[str, str]) -> dict[str, str]:
         """Check for conflicting pins."""
         err = {}
-        if user_input.get(CONF_PIN) is not None:
-            if user_input[CONF_PIN_RED] == user_input[CONF_PIN_GREEN]:
-                err[CONF_PIN_GREEN] = "Green light uses same pin number as red light!"
-            if user_input[CONF_PIN_RED] == user_input[CONF_PIN_BLUE]:
-                err[CONF_PIN_BLUE] = "Blue light uses same pin number as red light!"
-            if user_input[CONF_PIN_GREEN] == user_input[CONF_PIN_BLUE]:
-                err[CONF_PIN_GREEN] = "Blue light uses same pin number as green light!"
-            if user_input.get(CONF_PIN_WHITE):
-                if user_input[CONF_PIN_RED] == user_input[CONF_PIN_WHITE]:
-                    err[CONF_PIN_RED] = "White light uses same number as red light!"
-                if user_input[CONF_PIN_GREEN] == user_input[CONF_PIN_WHITE]:
-                    err[CONF_PIN_GREEN] = "White light uses same number as green light!"
-                if user_input[CONF_PIN_BLUE] == user_input[CONF_PIN_WHITE]:
-                    err[CONF_PIN_BLUE] = "White light uses same number as blue light!"
+        # Map each pin number to the first color key using it
+        seen: dict[str, str] = {}
+        for key in _COLOR_PIN_KEYS:
+            if not (pin := user_input.get(key)):
+                continue
+            if (first := seen.setdefault(pin, key)) != key:
+                err[key] = _PIN_CONFLICT_ERRORS[first, key]
         return err
 
     def _make_entity_title(self, user_input: dict[str, Any]) -> str:
         """Create a title for the entity."""
-        title = user_input[CONF_NAME] + " @ pin "
         if user_input.get(CONF_PIN) is None:
-            title += (
-                user_input[CONF_PIN_RED]
-                + ","
-                + user_input[CONF_PIN_GREEN]
-                + ","
-                + user_input[CONF_PIN_BLUE]
-            )
-            if user_input.get(CONF_PIN_WHITE):
-                title += "," + user_input[CONF_PIN_WHITE]
-        else:
-            title += user_input[CONF_PIN]
-        return title
+            pins = [user_input[key] for key in _COLOR_PIN_KEYS if user_input.get(key)]
+            return f"{user_input[CONF_NAME]} @ pin {','.join(pins)}"
+        return f"{user_input[CONF_NAME]} @ pin {user_input[CONF_PIN]}"
 
     async def async_step_simple_light(
         self, user_input: dict[str, Any] | None = None
@@ -290,7 +339,7 @@ class PCA9685LedSubentryFlowHandler(ConfigSubentryFlow):
             # Check for correct input
             err = self._check_pin_conflicts(user_input)
 
-            if len(err):
+            if err:
                 if user_input.get(CONF_PIN_WHITE):
                     schema = self._generate_schema_rgbw_light()
                 else:
@@ -337,27 +386,21 @@ class PCA9685LedSubentryFlowHandler(ConfigSubentryFlow):
                 )
         self._update_free_pins()
 
-        # Append also the current pins to the free-pins list
+        # Release also the current pins of this entity
         # and generate entity specific schema
         data = self._get_reconfigure_subentry().data
+        for key in _PIN_KEYS:
+            if (pin := data.get(key)) is not None:
+                self._release_pin(pin)
         if data.get(CONF_PIN) is not None:
-            self._pins.append(data[CONF_PIN])
-            self._pins.sort(key=lambda a: int(a))
             if data[CONF_TYPE] == Platform.LIGHT:
                 schema = self._generate_schema_simple_light()
             else:
                 schema = self._generate_schema_number()
+        elif data.get(CONF_PIN_WHITE) is not None:
+            schema = self._generate_schema_rgbw_light()
         else:
-            self._pins.append(data[CONF_PIN_RED])
-            self._pins.append(data[CONF_PIN_GREEN])
-            self._pins.append(data[CONF_PIN_BLUE])
-            if data.get(CONF_PIN_WHITE) is not None:
-                self._pins.append(data[CONF_PIN_WHITE])
-                self._pins.sort(key=lambda a: int(a))
-                schema = self._generate_schema_rgbw_light()
-            else:
-                self._pins.sort(key=lambda a: int(a))
-                schema = self._generate_schema_rgb_light()
+            schema = self._generate_schema_rgb_light()
 
         schema = self.add_suggested_values_to_schema(schema, data)
 
@@ -378,19 +421,12 @@ class PCA9685ConfigFlow(ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             # Check if the device was already configured.
-            exists = False
-            for pca in self.hass.config_entries.async_entries(DOMAIN):
-                exists |= (pca.data[CONF_BUS] == user_input[CONF_BUS]) and (
-                    pca.data[CONF_ADDR] == user_input[CONF_ADDR]
-                )
-
-            if not exists:
+            if not self._is_configured(user_input):
                 return self.async_create_entry(
-                    title="PCA9685 Device (address "
-                    + str(int(user_input[CONF_ADDR]))
-                    + " @ "
-                    + user_input[CONF_BUS]
-                    + ")",
+                    title=(
+                        f"PCA9685 Device (address {int(user_input[CONF_ADDR])}"
+                        f" @ {user_input[CONF_BUS]})"
+                    ),
                     data=user_input,
                 )
             errors[CONF_ADDR] = "already_configured"
@@ -407,14 +443,10 @@ class PCA9685ConfigFlow(ConfigFlow, domain=DOMAIN):
         """Reconfigure the PCA9685 device."""
         errors = {}
         if user_input is not None:
-            # Check if the device was already configured.
-            exists = False
-            for pca in self.hass.config_entries.async_entries(DOMAIN):
-                exists |= (pca.data[CONF_BUS] == user_input[CONF_BUS]) and (
-                    pca.data[CONF_ADDR] == user_input[CONF_ADDR]
-                )
-
-            if not exists:
+            # Check if the device was already configured by another entry.
+            if not self._is_configured(
+                user_input, skip_entry_id=self._get_reconfigure_entry().entry_id
+            ):
                 return self.async_update_reload_and_abort(
                     self._get_reconfigure_entry(),
                     data_updates=user_input,
@@ -429,45 +461,33 @@ class PCA9685ConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="reconfigure", data_schema=schema, errors=errors
         )
 
+    def _is_configured(
+        self, user_input: dict[str, Any], skip_entry_id: str | None = None
+    ) -> bool:
+        """Check if a PCA9685 is configured at the bus & address of user_input."""
+        device = (user_input[CONF_BUS], user_input[CONF_ADDR])
+        return any(
+            (pca.data[CONF_BUS], pca.data[CONF_ADDR]) == device
+            for pca in self.hass.config_entries.async_entries(DOMAIN)
+            if pca.entry_id != skip_entry_id
+        )
+
     async def _async_bus_scheme(self) -> vol.Schema:
         """Generate scheme for configuring the I2C bus."""
-
-        def blocking_code() -> list[str]:
-            return [str(bus) for bus in Path("/dev/").glob("i2c-*")]
-
-        # First check if an I2C bus is available
-        i2c_busses = await self.hass.async_add_executor_job(blocking_code)
-        i2c_bus_selector = [
-            selector.SelectOptionDict(value=bus, label=bus) for bus in i2c_busses
-        ]
-        # find out what adresses on this bus are already in use.
-        # Set default to first not-used adress
-
-        return vol.Schema(
-            {
-                vol.Optional(CONF_BUS, default=i2c_busses[0]): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=i2c_bus_selector),
-                ),
-                vol.Optional(CONF_ADDR, default=DEFAULT_ADDR): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=CONST_ADDR_MIN,
-                        max=CONST_ADDR_MAX,
-                        mode=selector.NumberSelectorMode.BOX,
-                        step=1,
-                    ),
-                ),
-                vol.Optional(
-                    CONF_FREQUENCY, default=DEFAULT_FREQ
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=CONST_PWM_FREQ_MIN,
-                        max=CONST_PWM_FREQ_MAX,
-                        mode=selector.NumberSelectorMode.BOX,
-                        step=1,
-                    ),
-                ),
-            }
-        )
+        # First check if an I2C bus is available. Re-use a recent scan, so
+        # re-rendering the form does not hit /dev again.
+        pca9685_data = self.hass.data.setdefault(DOMAIN, {})
+        cached = pca9685_data.get(PCA9685_I2C_BUSSES)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < CONST_I2C_BUS_CACHE_TTL:
+            i2c_busses = cached[1]
+        else:
+            i2c_busses = await self.hass.async_add_executor_job(_list_i2c_buses)
+            pca9685_data[PCA9685_I2C_BUSSES] = (now, i2c_busses)
+        if not i2c_busses:
+            msg = "no_i2c_bus"
+            raise AbortFlow(msg)
+        return _bus_schema(tuple(i2c_busses))
 
     @classmethod
     @callback
@@ -1,5 +1,6 @@
 """Constants for the pca9685 integration."""
 
+from datetime import timedelta
 from typing import Final
 
 DOMAIN = "pca9685"
@@ -31,6 +32,10 @@ DEFAULT_BRIGHTNESS = 255
 DEFAULT_COLOR = (0.0, 0.0)
 DEFAULT_FREQ = 200
 DEFAULT_MODE = "auto"
+# Same defaults as homeassistant.components.number
+DEFAULT_NUMBER_MIN = 0.0
+DEFAULT_NUMBER_MAX = 100.0
+DEFAULT_NUMBER_STEP = 1.0
 
 CONST_SIMPLE_LED_PINS = 1
 CONST_RGB_LED_PINS = 3
@@ -44,5 +49,12 @@ CONST_ADDR_MIN = 64
 CONST_ADDR_MAX = 127
 CONST_PWM_FREQ_MIN = 24
 CONST_PWM_FREQ_MAX = 1526
+CONST_I2C_BUS_CACHE_TTL = 5.0  # seconds
+CONST_RELOAD_COOLDOWN = 1.0  # seconds
+CONST_TRANSITION_LEVEL = 16  # PWM units per visible brightness step
+CONST_TRANSITION_MIN_STEP = timedelta(milliseconds=50)
 
 PCA9685_DRIVERS: Final = "pca9685_drivers"
+PCA9685_RELOAD_DEBOUNCERS: Final = "pca9685_reload_debouncers"
+PCA9685_I2C_BUSSES: Final = "pca9685_i2c_busses"
+PCA9685_TRANSITIONS: Final = "pca9685_transitions"
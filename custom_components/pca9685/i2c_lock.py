@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import time
+from weakref import WeakValueDictionary
 
 from homeassistant.core import HomeAssistant
 
@@ -130,18 +131,19 @@ def get_i2c_bus_lock(
     lock_store_key: str,
     bus: int,
 ) -> tuple[object, bool]:
-    """Return the shared async lock for one I2C bus."""
-    if lock_store_key not in hass.data:
-        hass.data[lock_store_key] = {}
-
-    created = False
-    bus_locks = hass.data[lock_store_key]
-    if bus not in bus_locks:
-        bus_locks[bus] = asyncio.Lock()
-        created = True
-
-    lock = _normalize_async_lock(bus_locks[bus])
-    if lock is not bus_locks[bus]:
+    """
+    Return the shared async lock for one I2C bus.
+
+    The registry only holds the locks weakly; the drivers using a bus keep its
+    lock alive, so it is dropped together with the last driver on that bus.
+    """
+    bus_locks = hass.data.setdefault(lock_store_key, WeakValueDictionary())
+    new_lock = asyncio.Lock()
+    stored = bus_locks.setdefault(bus, new_lock)
+    created = stored is new_lock
+
+    lock = _normalize_async_lock(stored)
+    if lock is not stored:
         bus_locks[bus] = lock
 
     if getattr(lock, "_copilot_instrumented_i2c_lock", False):
@@ -1,10 +1,12 @@
 """Support for LED lights that can be controlled using PWM."""
 
+import asyncio
+import functools
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 
 import homeassistant.util.color as color_util
-import homeassistant.util.dt as dt_util
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_HS_COLOR,
@@ -13,19 +15,16 @@ from homeassistant.components.light import (
     LightEntity,
     LightEntityFeature,
 )
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 from homeassistant.const import (
     CONF_NAME,
     CONF_TYPE,
     STATE_ON,
     Platform,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.event import (
-    async_track_time_interval,
-)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType
 
@@ -37,15 +36,21 @@ from .const import (
     CONF_PIN_WHITE,
     CONST_PCA_INT_MULTIPLIER,
     CONST_RGBW_LED_PINS,
+    CONST_TRANSITION_LEVEL,
+    CONST_TRANSITION_MIN_STEP,
     DEFAULT_BRIGHTNESS,
     DEFAULT_COLOR,
     DOMAIN,
     PCA9685_DRIVERS,
+    PCA9685_TRANSITIONS,
 )
 from .pca_driver import PCA9685Driver
 
 _LOGGER = logging.getLogger(__name__)
 
+# Takes one transition step at the given loop time, returns False once finished
+_StepFunction = Callable[[float], Awaitable[bool]]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -57,43 +62,79 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
 
-    entities = []
-    for unique_id, entry in config_entry.subentries.items():
-        if entry.data[CONF_TYPE] == Platform.LIGHT:
-            if entry.data.get(CONF_PIN) is not None:
-                entities.append(
-                    PwmSimpleLed(
-                        driver=pca_driver,
-                        pin=int(entry.data[CONF_PIN]),
-                        name=entry.data[CONF_NAME],
-                        unique_id=unique_id,
-                        config_unique_id=str(config_entry.unique_id),
-                    )
-                )
-            else:
-                pin_white = entry.data.get(CONF_PIN_WHITE, None)
-                if pin_white is not None:
-                    pin_white = int(pin_white)
-                entities.append(
-                    PwmRgbwLed(
-                        driver=pca_driver,
-                        name=entry.data[CONF_NAME],
-                        pin_red=int(entry.data[CONF_PIN_RED]),
-                        pin_green=int(entry.data[CONF_PIN_GREEN]),
-                        pin_blue=int(entry.data[CONF_PIN_BLUE]),
-                        pin_white=pin_white,
-                        unique_id=unique_id,
-                        config_unique_id=str(config_entry.unique_id),
-                    )
-                )
+    config_unique_id = str(config_entry.unique_id)
+    entities = [
+        light
+        for unique_id, entry in config_entry.subentries.items()
+        if entry.data[CONF_TYPE] == Platform.LIGHT
+        and (light := _create_light(pca_driver, unique_id, entry, config_unique_id))
+        is not None
+    ]
 
     async_add_entities(entities)
 
 
+class _TransitionTicker:
+    """Step all running light transitions from one shared task."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an idle ticker."""
+        self._hass = hass
+        # key -> (step function, step interval, loop time the next step is due)
+        self._transitions: dict[object, tuple[_StepFunction, float, float]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def register(self, key: object, step: _StepFunction, interval: timedelta) -> None:
+        """Start stepping a transition, replacing an earlier one for the same key."""
+        self._transitions[key] = (step, interval.total_seconds(), 0.0)
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} light transitions"
+            )
+
+    def unregister(self, key: object) -> bool:
+        """Stop stepping a transition, return whether one was running."""
+        return self._transitions.pop(key, None) is not None
+
+    async def _async_run(self) -> None:
+        """Take the steps that are due, until no transition is left."""
+        tick = CONST_TRANSITION_MIN_STEP.total_seconds()
+        while self._transitions:
+            now = self._hass.loop.time()
+            due = [
+                (key, step, interval)
+                for key, (step, interval, next_step) in self._transitions.items()
+                if next_step <= now
+            ]
+            for key, step, interval in due:
+                self._transitions[key] = (step, interval, now + interval)
+            results = await asyncio.gather(
+                *(step(now) for _, step, _ in due), return_exceptions=True
+            )
+            for (key, step, _), running in zip(due, results, strict=True):
+                if isinstance(running, Exception):
+                    _LOGGER.warning("Stopped transition of %s: %s", key, running)
+                elif running:
+                    continue
+                # Keep a transition that replaced this one during the step
+                if key in self._transitions and self._transitions[key][0] is step:
+                    self.unregister(key)
+            await asyncio.sleep(tick)
+
+
+def _transition_ticker(hass: HomeAssistant) -> _TransitionTicker:
+    """Return the ticker shared by all lights of this integration."""
+    pca9685_data = hass.data.setdefault(DOMAIN, {})
+    if (ticker := pca9685_data.get(PCA9685_TRANSITIONS)) is None:
+        ticker = pca9685_data[PCA9685_TRANSITIONS] = _TransitionTicker(hass)
+    return ticker
+
+
 class PwmSimpleLed(LightEntity, RestoreEntity):
     """Representation of a simple one-color PWM LED."""
 
     _attr_color_mode = ColorMode.BRIGHTNESS
+    _attr_should_poll = False
 
     def __init__(
         self,
@@ -117,14 +158,16 @@ class PwmSimpleLed(LightEntity, RestoreEntity):
         self._attr_supported_features |= LightEntityFeature.TRANSITION
         self._pin: int = pin
         self._attr_name = name
-        self._transition_step_time = timedelta(
-            milliseconds=150
-        )  # Transition step time in ms
-        self._transition_lister: CALLBACK_TYPE | None = None
-        self._transition_start = dt_util.utcnow().replace(microsecond=0)
-        self._transition_end = self._transition_start
+        self._transition_step_time = CONST_TRANSITION_MIN_STEP
+        # Bumped on every new command, steps of older transitions then stop
+        self._transition_generation = 0
+        # Event loop (monotonic) time in seconds
+        self._transition_start: float = 0.0
+        self._transition_end: float = 0.0
         self._transition_begin_brightness: int = 0
         self._transition_end_brightness: int = 0
+        self._transition_slope: float = 0.0  # PWM units per second
+        self._last_commanded: int | None = None
         self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
     async def async_added_to_hass(self) -> None:
@@ -156,13 +199,13 @@ class PwmSimpleLed(LightEntity, RestoreEntity):
             if not self._attr_is_on:
                 self._attr_brightness = restored_brightness
 
-    @property
-    def should_poll(self) -> bool:
-        """No polling needed."""
-        return False
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop a running transition when the entity is removed."""
+        self._cancel_transition()
 
     async def async_turn_on(self, **kwargs: ConfigType) -> None:
         """Turn on a led."""
+        self._cancel_transition()
         if ATTR_BRIGHTNESS in kwargs:
             self._attr_brightness = kwargs[ATTR_BRIGHTNESS]
         elif not self._attr_brightness or self._attr_brightness <= 0:
@@ -175,16 +218,18 @@ class PwmSimpleLed(LightEntity, RestoreEntity):
                 duration=timedelta(seconds=transition_time),
             )
         else:
-            await self._driver.set_pwm(
-                led_num=self._pin, value=_from_hass_brightness(self._attr_brightness)
-            )
+            brightness = _from_hass_brightness(self._attr_brightness)
+            await self._driver.set_pwm(led_num=self._pin, value=brightness)
+            self._last_commanded = brightness
 
         self._attr_is_on = True
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: ConfigType) -> None:
         """Turn off a LED."""
-        if self.is_on:
+        # A fade to off already reports the light as off; still stop it at 0.
+        cancelled = self._cancel_transition()
+        if self.is_on or cancelled:
             if ATTR_TRANSITION in kwargs:
                 transition_time = kwargs[ATTR_TRANSITION]
                 await self._async_start_transition(
@@ -192,58 +237,73 @@ class PwmSimpleLed(LightEntity, RestoreEntity):
                 )
             else:
                 await self._driver.set_pwm(led_num=self._pin, value=0)
+                self._last_commanded = 0
 
         self._attr_is_on = False
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def _async_start_transition(
         self, brightness: int, duration: timedelta
     ) -> None:
         """Start light transitio."""
         # First check if a transition was in progress; in that case stop it.
-        if self._transition_lister:
-            self._transition_lister()
+        self._cancel_transition()
+        # Nothing to do if the output was already commanded to this value.
+        if brightness == self._last_commanded:
+            return
+        # A transition shorter than one step is just a direct write.
+        if duration <= CONST_TRANSITION_MIN_STEP:
+            await self._driver.set_pwm(led_num=self._pin, value=brightness)
+            self._last_commanded = brightness
+            return
         # initialize relevant values
         self._transition_begin_brightness = await self._driver.get_pwm(self._pin)
         if self._transition_begin_brightness != brightness:
-            self._transition_start = dt_util.utcnow()
-            self._transition_end = self._transition_start + duration
+            self._transition_start = self.hass.loop.time()
+            self._transition_end = self._transition_start + duration.total_seconds()
             self._transition_end_brightness = brightness
+            self._transition_slope = _slope(
+                self._transition_begin_brightness, brightness, duration
+            )
+            self._transition_step_time = _step_time(
+                duration, brightness - self._transition_begin_brightness
+            )
             # Start transition cycles.
-            self._transition_lister = async_track_time_interval(
-                self.hass, self._async_step_transition, self._transition_step_time
+            _transition_ticker(self.hass).register(
+                self,
+                functools.partial(
+                    self._async_step_transition,
+                    generation=self._transition_generation,
+                ),
+                self._transition_step_time,
             )
-
-    @callback
-    async def _async_step_transition(self, args: None = None) -> None:  # noqa: ARG002
-        """Cycle for transition of output."""
-        # Calculate switch off time, and if in the future, add a lister to hass
-        now = dt_util.utcnow()
+        else:
+            self._last_commanded = brightness
+
+    def _cancel_transition(self) -> bool:
+        """Stop a transition that is in progress, return whether one was."""
+        self._transition_generation += 1
+        return _transition_ticker(self.hass).unregister(self)
+
+    async def _async_step_transition(self, now: float, generation: int) -> bool:
+        """Cycle for transition of output, return False once it is finished."""
+        # The ticker may already have scheduled this step when a newer command
+        # cancelled the transition; a stale step must not write anything.
+        if generation != self._transition_generation:
+            return False
         if now > self._transition_end:
-            await self._driver.set_pwm(
-                led_num=self._pin, value=self._transition_end_brightness
-            )
-            if self._transition_lister:
-                self._transition_lister()  # Stop cycling
+            target_brightness = self._transition_end_brightness
         else:
-            elapsed: float = (now - self._transition_start).total_seconds()
-            total_transition: float = (
-                self._transition_end - self._transition_start
-            ).total_seconds()
-            target_brightness = int(
-                self._transition_begin_brightness
-                + (
-                    (
-                        (
-                            self._transition_end_brightness
-                            - self._transition_begin_brightness
-                        )
-                        * elapsed
-                    )
-                    / total_transition
-                )
+            elapsed = now - self._transition_start
+            target_brightness = self._transition_begin_brightness + int(
+                self._transition_slope * elapsed
             )
-            await self._driver.set_pwm(led_num=self._pin, value=target_brightness)
+        await self._driver.set_pwm(led_num=self._pin, value=target_brightness)
+        # The newer command writes after this step, it also owns the cache
+        if generation != self._transition_generation:
+            return False
+        self._last_commanded = target_brightness
+        return now <= self._transition_end
 
 
 class PwmRgbwLed(PwmSimpleLed):
@@ -271,11 +331,13 @@ class PwmRgbwLed(PwmSimpleLed):
         self._attr_supported_color_modes: set[ColorMode] = {self._attr_color_mode}
         self._attr_hs_color = DEFAULT_COLOR
         _LOGGER.debug("color: %s", self._attr_hs_color)
-        self._pins: list[int] = [pin_red, pin_green, pin_blue]
+        self._pins: tuple[int, ...] = (pin_red, pin_green, pin_blue)
         if pin_white is not None:
-            self._pins.append(pin_white)
+            self._pins += (pin_white,)
         self._transition_begin_brightness: list[int] = []
         self._transition_end_brightness: list[int] = []
+        self._transition_slope: list[float] = []
+        self._last_commanded: list[int] | None = None
 
     async def async_added_to_hass(self) -> None:
         """Handle entity about to be added to hass event."""
@@ -320,6 +382,7 @@ class PwmRgbwLed(PwmSimpleLed):
 
     async def async_turn_on(self, **kwargs: ConfigType) -> None:
         """Turn on a LED."""
+        self._cancel_transition()
         if ATTR_HS_COLOR in kwargs:
             self._attr_hs_color = kwargs[ATTR_HS_COLOR]
         if ATTR_BRIGHTNESS in kwargs:
@@ -327,14 +390,17 @@ class PwmRgbwLed(PwmSimpleLed):
         elif not self._attr_brightness or self._attr_brightness <= 0:
             self._attr_brightness = DEFAULT_BRIGHTNESS
 
-        color = list(color_util.color_hs_to_RGB(*self._attr_hs_color))
+        # Round to the precision the UI uses so float noise does not miss the cache
+        hue, saturation = (round(value, 1) for value in self._attr_hs_color)
+        rgb = _cached_hs_to_rgb(hue, saturation)
         if len(self._pins) == CONST_RGBW_LED_PINS:
-            color = list(color_util.color_rgb_to_rgbw(color[0], color[1], color[2]))
+            color = list(_cached_rgb_to_rgbw(*rgb))
+        else:
+            color = list(rgb)
         brightness = _from_hass_brightness(self._attr_brightness)
-        max_value = float(max(color))
-        for i in range(len(color)):
-            color[i] = int((color[i] / max_value) * brightness)
-            _LOGGER.debug("Set color [%d] to value %d", i, color[i])
+        max_value = max(color) or 1
+        color = [value * brightness // max_value for value in color]
+        _LOGGER.debug("Set colors to values %s", color)
 
         if ATTR_TRANSITION in kwargs:
             transition_time: timedelta = kwargs[ATTR_TRANSITION]
@@ -343,15 +409,17 @@ class PwmRgbwLed(PwmSimpleLed):
                 duration=timedelta(seconds=transition_time),
             )
         else:
-            for i in range(len(self._pins)):
-                await self._driver.set_pwm(led_num=self._pins[i], value=color[i])
+            await self._driver.set_pwm_multi(dict(zip(self._pins, color, strict=True)))
+            self._last_commanded = color
 
         self._attr_is_on = True
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: ConfigType) -> None:
         """Turn off a LED."""
-        if self.is_on:
+        # A fade to off already reports the light as off; still stop it at 0.
+        cancelled = self._cancel_transition()
+        if self.is_on or cancelled:
             color = [0, 0, 0]
             if len(self._pins) == CONST_RGBW_LED_PINS:
                 color.append(0)
@@ -361,77 +429,153 @@ class PwmRgbwLed(PwmSimpleLed):
                     brightness=color, duration=timedelta(seconds=transition_time)
                 )
             else:
-                for i in range(len(self._pins)):
-                    await self._driver.set_pwm(led_num=self._pins[i], value=0)
+                await self._driver.set_pwm_multi(
+                    dict(zip(self._pins, color, strict=True))
+                )
+                self._last_commanded = color
 
         self._attr_is_on = False
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def _async_start_transition(
         self, brightness: list[int], duration: timedelta
     ) -> None:
         """Start light transitio."""
         # First check if a transition was in progress; in that case stop it.
-        if self._transition_lister:
-            self._transition_lister()
-        # initialize relevant values
-        self._transition_begin_brightness.clear()
-        color_is_different = False
-        for i in range(len(self._pins)):
-            self._transition_begin_brightness.append(
-                await self._driver.get_pwm(self._pins[i])
+        self._cancel_transition()
+        # Nothing to do if the output was already commanded to this value.
+        if brightness == self._last_commanded:
+            return
+        # A transition shorter than one step is just a direct write.
+        if duration <= CONST_TRANSITION_MIN_STEP:
+            await self._driver.set_pwm_multi(
+                dict(zip(self._pins, brightness, strict=True))
             )
-            if self._transition_begin_brightness[i] != brightness[i]:
-                color_is_different = True
-
-        if color_is_different:
-            self._transition_start = dt_util.utcnow()
-            self._transition_end = self._transition_start + duration
+            self._last_commanded = brightness
+            return
+        # initialize relevant values
+        self._transition_begin_brightness = [
+            await self._driver.get_pwm(pin) for pin in self._pins
+        ]
+        if self._transition_begin_brightness != brightness:
+            self._transition_start = self.hass.loop.time()
+            self._transition_end = self._transition_start + duration.total_seconds()
             self._transition_end_brightness = brightness
+            self._transition_slope = [
+                _slope(begin, end, duration)
+                for begin, end in zip(
+                    self._transition_begin_brightness, brightness, strict=True
+                )
+            ]
+            self._transition_step_time = _step_time(
+                duration,
+                max(
+                    abs(end - begin)
+                    for begin, end in zip(
+                        self._transition_begin_brightness, brightness, strict=True
+                    )
+                ),
+            )
             # Start transition cycles.
-            self._transition_lister = async_track_time_interval(
-                self.hass, self._async_step_transition, self._transition_step_time
+            _transition_ticker(self.hass).register(
+                self,
+                functools.partial(
+                    self._async_step_transition,
+                    generation=self._transition_generation,
+                ),
+                self._transition_step_time,
             )
+        else:
+            self._last_commanded = brightness
 
-    @callback
-    async def _async_step_transition(self, args: None = None) -> None:  # noqa: ARG002
-        """Cycle for transition of output."""
-        # Calculate switch off time, and if in the future, add a lister to hass
-        now = dt_util.utcnow()
+    async def _async_step_transition(self, now: float, generation: int) -> bool:
+        """Cycle for transition of output, return False once it is finished."""
+        # See PwmSimpleLed._async_step_transition
+        if generation != self._transition_generation:
+            return False
         if now > self._transition_end:
-            for i in range(len(self._pins)):
-                await self._driver.set_pwm(
-                    led_num=self._pins[i], value=self._transition_end_brightness[i]
-                )
-            if self._transition_lister:
-                self._transition_lister()  # Stop cycling
+            targets = list(self._transition_end_brightness)
         else:
-            elapsed: float = (now - self._transition_start).total_seconds()
-            total_transition: float = (
-                self._transition_end - self._transition_start
-            ).total_seconds()
-            for i in range(len(self._pins)):
-                target_brightness = int(
-                    self._transition_begin_brightness[i]
-                    + (
-                        (
-                            (
-                                self._transition_end_brightness[i]
-                                - self._transition_begin_brightness[i]
-                            )
-                            * elapsed
-                        )
-                        / total_transition
-                    )
+            elapsed = now - self._transition_start
+            targets = [
+                begin + int(slope * elapsed)
+                for begin, slope in zip(
+                    self._transition_begin_brightness,
+                    self._transition_slope,
+                    strict=True,
                 )
-                self._driver.set_pwm(led_num=self._pins[i], value=target_brightness)
+            ]
+        await self._driver.set_pwm_multi(dict(zip(self._pins, targets, strict=True)))
+        if generation != self._transition_generation:
+            return False
+        self._last_commanded = targets
+        return now <= self._transition_end
+
+
+def _create_light(
+    driver: PCA9685Driver,
+    unique_id: str,
+    entry: ConfigSubentry,
+    config_unique_id: str,
+) -> PwmSimpleLed | None:
+    """Create the light of a subentry, or None if it is misconfigured."""
+    try:
+        if entry.data.get(CONF_PIN) is not None:
+            light = PwmSimpleLed(
+                driver=driver,
+                pin=int(entry.data[CONF_PIN]),
+                name=entry.data[CONF_NAME],
+                unique_id=unique_id,
+                config_unique_id=config_unique_id,
+            )
+        else:
+            pin_white = entry.data.get(CONF_PIN_WHITE)
+            light = PwmRgbwLed(
+                driver=driver,
+                name=entry.data[CONF_NAME],
+                pin_red=int(entry.data[CONF_PIN_RED]),
+                pin_green=int(entry.data[CONF_PIN_GREEN]),
+                pin_blue=int(entry.data[CONF_PIN_BLUE]),
+                pin_white=None if pin_white is None else int(pin_white),
+                unique_id=unique_id,
+                config_unique_id=config_unique_id,
+            )
+    except (KeyError, TypeError, ValueError):
+        # Skip only this light, the others of the device can still be set up
+        _LOGGER.exception("Skipping misconfigured light %s", entry.title)
+        return None
+    return light
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_hs_to_rgb(hue: float, saturation: float) -> tuple[int, int, int]:
+    """Convert a hue/saturation color to RGB."""
+    return color_util.color_hs_to_RGB(hue, saturation)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_rgb_to_rgbw(red: int, green: int, blue: int) -> tuple[int, int, int, int]:
+    """Convert a RGB color to RGBW."""
+    return color_util.color_rgb_to_rgbw(red, green, blue)
+
+
+def _slope(begin: int, end: int, duration: timedelta) -> float:
+    """Return the change in PWM units per second to go from begin to end."""
+    seconds = duration.total_seconds()
+    if seconds <= 0:
+        return 0.0
+    return (end - begin) / seconds
+
+
+def _step_time(duration: timedelta, delta: int) -> timedelta:
+    """Return a step time that changes the output about one visible level per step."""
+    steps = max(1, abs(delta) // CONST_TRANSITION_LEVEL)
+    return max(CONST_TRANSITION_MIN_STEP, duration / steps)
 
 
 def _from_hass_brightness(brightness: int | None) -> int:
     """Convert Home Assistant  units (0..256) to 0..4096."""
-    if brightness:
-        return brightness * CONST_PCA_INT_MULTIPLIER
-    return 0
+    return (brightness or 0) * CONST_PCA_INT_MULTIPLIER
 
 
 def _to_hass_brightness(brightness: int) -> int:
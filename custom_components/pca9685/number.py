@@ -41,6 +41,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+PWM_MAX_VALUE = 4095
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -96,63 +98,83 @@ class PwmNumber(RestoreNumber):
         self._attr_native_value = config[CONF_MINIMUM]
         self._attr_name = config[CONF_NAME]
         self._pin = int(config[CONF_PIN])
+        # Constants of the value to PWM code conversion
+        self._min: float = config[CONF_MINIMUM]
+        self._max: float = config[CONF_MAXIMUM]
+        self._invert: bool = config[CONF_INVERT]
+        self._norm_lo: float = config[CONF_NORMALIZE_LOWER]
+        self._norm_hi: float = config[CONF_NORMALIZE_UPPER]
+        range_value = self._norm_hi - self._norm_lo
+        self._scale = PWM_MAX_VALUE / range_value if range_value else 0.0
+        # PWM frequency of the device, read once when added to hass
+        self._frequency: int | None = None
+        self._capability_attributes: dict[str, Any] | None = None
+        # PWM code last written to the driver, None until the first write
+        self._last_scaled: int | None = None
 
     async def async_added_to_hass(self) -> None:
         """Handle entity about to be added to hass event."""
         await super().async_added_to_hass()
+        # The frequency only changes through the device config, which reloads
+        # the entry and with it this entity.
+        self._frequency = await self._driver.get_pwm_frequency()
+        self._capability_attributes = None
+        value = self._min
         if last_data := await self.async_get_last_number_data():
             try:
-                await self.async_set_native_value(float(last_data.native_value))
-            except ValueError:
+                value = float(last_data.native_value)
+            except (TypeError, ValueError):
                 _LOGGER.warning(
                     "Could not read value %s from last state data for %s!",
                     last_data.native_value,
                     self.name,
                 )
-        else:
-            await self.async_set_native_value(self._config[CONF_MINIMUM])
+        # Nothing was written yet, so this always programs the output once
+        await self.async_set_native_value(value)
 
     @property
-    async def frequency(self) -> int:
+    def frequency(self) -> int | None:
         """Return PWM frequency."""
-        return await self._driver.get_pwm_frequency()
+        return self._frequency
 
     @property
     def invert(self) -> bool:
         """Return if output is inverted."""
-        return self._config[CONF_INVERT]
+        return self._invert
 
     @property
-    async def capability_attributes(self) -> dict[str, Any]:
+    def capability_attributes(self) -> dict[str, Any]:
         """Return capability attributes."""
-        attr = super().capability_attributes
-        attr[ATTR_FREQUENCY] = await self.frequency
-        attr[ATTR_INVERT] = self.invert
-        return attr
+        # Limits, step, mode, frequency and invert are fixed for the entity
+        if self._capability_attributes is None:
+            self._capability_attributes = {
+                **super().capability_attributes,
+                ATTR_FREQUENCY: self.frequency,
+                ATTR_INVERT: self.invert,
+            }
+        return self._capability_attributes
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
         # Clip value to limits (don't know if this is required?)
-        value = max(value, self._config[CONF_MINIMUM])
-        value = min(value, self._config[CONF_MAXIMUM])
+        value = min(max(value, self._min), self._max)
+        if value == self._attr_native_value and self._last_scaled is not None:
+            return
 
         # In case the invert bit is on, invert the value
-        used_value = value
-        if self._config[CONF_INVERT]:
-            used_value = self._config[CONF_NORMALIZE_UPPER] - value
-        used_value -= self._config[CONF_NORMALIZE_LOWER]
-        # Scale range from N_L..N_U to 0..65535 (pca9685)
-        range_pwm = 4095
-        range_value = (
-            self._config[CONF_NORMALIZE_UPPER] - self._config[CONF_NORMALIZE_LOWER]
-        )
-
-        # Scale to range of the driver
-        scaled_value = round((used_value / range_value) * range_pwm)
+        used_value = self._norm_hi - value if self._invert else value
+        used_value -= self._norm_lo
+        # Scale range from N_L..N_U to 0..4095 (pca9685)
+        # Round half up, values below 0 are clamped to 0 right after
+        scaled_value = int(used_value * self._scale + 0.5)
         # Make sure it will fit in the 12-bits range of the pca9685
-        scaled_value = min(range_pwm, scaled_value)
-        scaled_value = max(0, scaled_value)
-        # Set value to driver
-        await self._driver.set_pwm(led_num=self._pin, value=scaled_value)
+        if scaled_value < 0:
+            scaled_value = 0
+        elif scaled_value > PWM_MAX_VALUE:
+            scaled_value = PWM_MAX_VALUE
+        # Set value to driver, unless the output already has this PWM code
+        if scaled_value != self._last_scaled:
+            await self._driver.set_pwm(led_num=self._pin, value=scaled_value)
+            self._last_scaled = scaled_value
         self._attr_native_value = value
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
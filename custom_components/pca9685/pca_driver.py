@@ -1,11 +1,14 @@
 """Driver code for PCA9685 LED driver."""
+import contextlib
 import importlib
 import logging
+import time
 from ctypes import c_ulong
+from enum import IntEnum
 from pathlib import Path
 from types import MappingProxyType
 
-from smbus3 import SMBus
+from smbus3 import SMBus, i2c_msg
 
 from .const import CONST_PWM_FREQ_MAX, CONST_PWM_FREQ_MIN, DEFAULT_ADDR
 
@@ -13,6 +16,15 @@ _LOGGER = logging.getLogger(__name__)
 
 SIMULATE = False
 
+# Time the oscillator needs to stabilize after leaving sleep (datasheet 7.3.1.1)
+OSCILLATOR_STARTUP_TIME = 0.0005  # seconds
+# Maximum number of data bytes in one SMBus block transaction
+I2C_SMBUS_BLOCK_MAX = 32
+# Upper bounds that the write paths check inline
+LED_NUMBER_MAX = 15
+LED_VALUE_MAX = 4095
+REGISTER_VALUE_MAX = 255
+
 
 def _is_smbus_buffer_overflow(error: BaseException) -> bool:
     """Check whether an error is the known smbus3 Python 3.14 overflow issue."""
@@ -38,6 +50,30 @@ class PCA9685Error(Exception):
     """Something goes wrong with the pca9685 driver."""
 
 
+class _SimulatedBus:
+    """Stand-in for SMBus when SIMULATE is set: writes are dropped, reads return 0."""
+
+    def read_byte_data(self, _address: int, _register: int) -> int:
+        return 0
+
+    def read_i2c_block_data(
+        self, _address: int, _register: int, length: int
+    ) -> list[int]:
+        return [0] * length
+
+    def write_byte_data(self, *_args: object) -> None:
+        pass
+
+    def write_i2c_block_data(self, *_args: object) -> None:
+        pass
+
+    def i2c_rdwr(self, *_msgs: object) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
 class Registers:
     """Registers of the pca9685."""
 
@@ -70,27 +106,31 @@ class Mode2:
     OUTNE_0 = 0
 
 
-def value_low(val: int) -> int:
-    """Value of lower byte."""
-    return val & 0xFF
+# LEDn OFF Low Byte register of each of the 16 LEDs
+LED_OFF_REGISTERS = tuple(Registers.LED_STRIP_START + 2 + (n * 4) for n in range(16))
+
 
+class _RangeKind(IntEnum):
+    """Kinds of values the driver checks, index into _RANGES."""
 
-def value_high(val: int) -> int:
-    """Value of higher byte."""
-    return (val >> 8) & 0xFF
+    PWM_FREQUENCY = 0
+    LED_NUMBER = 1
+    LED_VALUE = 2
+    REGISTER_VALUE = 3
+
+
+_RANGES: tuple[tuple[int, int], ...] = (
+    (CONST_PWM_FREQ_MIN, CONST_PWM_FREQ_MAX),
+    (0, LED_NUMBER_MAX),
+    (0, LED_VALUE_MAX),
+    (0, REGISTER_VALUE_MAX),
+)
 
 
 class PCA9685Driver:
     """Device class controlling the PCA9685."""
 
-    ranges = MappingProxyType(
-        {
-            "pwm_frequency": (CONST_PWM_FREQ_MIN, CONST_PWM_FREQ_MAX),
-            "led_number": (0, 15),
-            "led_value": (0, 4095),
-            "register_value": (0, 255),
-        }
-    )
+    ranges = MappingProxyType({kind.name.lower(): _RANGES[kind] for kind in _RangeKind})
 
     def __init__(self,  i2c_bus: SMBus | int | str | None = None,
                  address: int = DEFAULT_ADDR) -> None:
@@ -120,6 +160,12 @@ class PCA9685Driver:
         self._device_lock = None
         self.__address: int = address
         self.__oscillator_clock = 25000000
+        # Last value written to or read from each LED, None until known
+        self.__shadow: list[int | None] = [None] * 16
+        # Last value of MODE1, read from the device at most once
+        self.__mode_1: int | None = None
+        # PWM frequency in Hz, as last programmed or read
+        self.__pwm_frequency: int | None = None
 
     async def init_async(self, hass, device_lock: object) -> None:
         """Initialize the driver asynchronously."""
@@ -127,14 +173,21 @@ class PCA9685Driver:
         self._device_lock = device_lock
         if self.__bus is None and self.__busnr is not None:
             self.__bus = await self._async_i2c_call(self._open_bus)
+            await self._async_i2c_call(self._enable_auto_increment)
+
+    async def close_async(self) -> None:
+        """Close the I2C bus of the driver asynchronously."""
+        if self.__bus is not None:
+            await self._async_i2c_call(self._close_bus)
 
     async def _async_i2c_call(self, func, *args):
         async with self._device_lock:
             return await self._hass.async_add_executor_job(func, *args)
 
     def _open_bus(self):
+        # Decide once here, read/write then never need to check SIMULATE
         if SIMULATE:
-            return None
+            return _SimulatedBus()
         bus = SMBus()
         try:
             bus.open(self.__busnr)
@@ -154,13 +207,27 @@ class PCA9685Driver:
             bus.open(self.__busnr)
         return bus
 
+    def _enable_auto_increment(self) -> None:
+        """Enable register auto-increment, needed for block writes."""
+        mode_1 = self.mode_1
+        if not mode_1 & (1 << Mode1.AI):
+            self.write(
+                Registers.MODE_1, (mode_1 & ~(1 << Mode1.RESTART)) | (1 << Mode1.AI)
+            )
+
+    def _close_bus(self) -> None:
+        if self.__bus is not None:
+            self.__bus.close()
+            self.__bus = None
 
     def get_i2c_bus_numbers(self) -> list[int]:
         """Search all the available I2C busses in the system."""
-        return [
-            self.get_i2c_bus_number_from_string(str(b))
-            for b in Path("/dev/").glob("i2c-*")
-        ]
+        busses = []
+        for device in Path("/dev").glob("i2c-*"):
+            # Strip the "i2c-" prefix, skip names without a bus number
+            with contextlib.suppress(ValueError):
+                busses.append(int(device.name[4:]))
+        return busses
 
     def get_i2c_bus_number_from_string(self, i2c_bus: str) -> int:
         """Find the I2C bus number in a string and convert to int."""
@@ -173,8 +240,11 @@ class PCA9685Driver:
 
     @property
     def mode_1(self) -> int:
-        """Returns the Mode 1 register value."""
-        return self.read(Registers.MODE_1)
+        """Returns the Mode 1 register value, without the self-clearing RESTART bit."""
+        if self.__mode_1 is None:
+            # Like after write(), the shadow never holds the RESTART bit
+            self.__mode_1 = self.read(Registers.MODE_1) & ~(1 << Mode1.RESTART)
+        return self.__mode_1
 
     @property
     def busnr(self) -> int | None:
@@ -195,13 +265,13 @@ class PCA9685Driver:
         start = Registers.LED_STRIP_START + 2
         return start + (led_num * 4)
 
-    def __check_range(self, option: str, value: int) -> None:
-        r = self.ranges[option]
-        if value < r[0]:
-            msg = f"{option} must be greater than {r[0]}, got {value}"
+    def __check_range(self, kind: _RangeKind, value: int) -> None:
+        low, high = _RANGES[kind]
+        if value < low:
+            msg = f"{kind.name.lower()} must be greater than {low}, got {value}"
             raise PCA9685Error(msg)
-        if value > r[1]:
-            msg = f"{option} must be less than {r[1]}, got {value}"
+        if value > high:
+            msg = f"{kind.name.lower()} must be less than {high}, got {value}"
             raise PCA9685Error(msg)
 
     async def set_pwm(self, led_num: int, value: int) -> None:
@@ -211,29 +281,75 @@ class PCA9685Driver:
         :param led_num: LED number (0-15)
         :param value: the 12 bit value (0-4095)
         """
-        self.__check_range("led_number", led_num)
-        self.__check_range("led_value", value)
+        if not (0 <= led_num <= LED_NUMBER_MAX and 0 <= value <= LED_VALUE_MAX):
+            # Let __check_range raise with the detailed message
+            self.__check_range(_RangeKind.LED_NUMBER, led_num)
+            self.__check_range(_RangeKind.LED_VALUE, value)
 
-        register_low = self.calc_led_register(led_num)
+        register_low = LED_OFF_REGISTERS[led_num]
         await self._async_i2c_call(self._set_pwm_sync, register_low, value)
+        self.__shadow[led_num] = value
 
     def _set_pwm_sync(self, register_low: int, value: int) -> None:
-        self.write(register_low, value_low(value))
-        self.write(register_low + 1, value_high(value))
+        # OFF_L and OFF_H in one transaction, relies on MODE1.AI set at init
+        self.write_block(register_low, [value & 0xFF, (value >> 8) & 0xFF])
+
+    async def set_pwm_multi(self, pin_to_value: dict[int, int]) -> None:
+        """
+        Set PWM values for several LEDs at once.
+
+        Values of adjacent LEDs are sent in a single block transaction.
+
+        :param pin_to_value: mapping of LED number (0-15) to 12 bit value (0-4095)
+        """
+        for led_num, value in pin_to_value.items():
+            if not (0 <= led_num <= LED_NUMBER_MAX and 0 <= value <= LED_VALUE_MAX):
+                self.__check_range(_RangeKind.LED_NUMBER, led_num)
+                self.__check_range(_RangeKind.LED_VALUE, value)
+        await self._async_i2c_call(
+            self._set_pwm_multi_sync, sorted(pin_to_value.items())
+        )
+        for led_num, value in pin_to_value.items():
+            self.__shadow[led_num] = value
+
+    def _set_pwm_multi_sync(self, updates: list[tuple[int, int]]) -> None:
+        register = next_led = 0
+        block: list[int] = []
+        for led_num, value in updates:
+            if block and led_num == next_led and len(block) + 4 <= I2C_SMBUS_BLOCK_MAX:
+                # Keep the ON registers in between at 0, like set_pwm assumes
+                block.extend((0, 0, value & 0xFF, (value >> 8) & 0xFF))
+            else:
+                if block:
+                    self.write_block(register, block)
+                register = LED_OFF_REGISTERS[led_num]
+                block = [value & 0xFF, (value >> 8) & 0xFF]
+            next_led = led_num + 1
+        if block:
+            self.write_block(register, block)
 
     async def __get_led_value(self, register_low: int) -> int:
         return await self._async_i2c_call(self._get_led_value_sync, register_low)
 
     def _get_led_value_sync(self, register_low: int) -> int:
-        low = self.read(register_low)
-        high = self.read(register_low + 1)
-        return low + (high * 256)
+        low, high = self.read_block(register_low, 2)
+        return low | (high << 8)
 
     async def get_pwm(self, led_num: int) -> int:
-        """Get LED PWM value."""
-        self.__check_range("led_number", led_num)
-        register_low = self.calc_led_register(led_num)
-        return await self.__get_led_value(register_low)
+        """
+        Get LED PWM value.
+
+        Only the first call per LED reads the device, after that the value last
+        written by this driver is returned.
+        """
+        if not 0 <= led_num <= LED_NUMBER_MAX:
+            self.__check_range(_RangeKind.LED_NUMBER, led_num)
+        value = self.__shadow[led_num]
+        if value is None:
+            register_low = LED_OFF_REGISTERS[led_num]
+            value = await self.__get_led_value(register_low)
+            self.__shadow[led_num] = value
+        return value
 
     def sleep(self) -> None:
         """Send the controller to sleep."""
@@ -253,10 +369,23 @@ class PCA9685Driver:
         :param value: byte value
         """
         # TODO(antonv): check reg: 0-69, 250-255  # noqa: FIX002, TD003
-        self.__check_range("register_value", value)
+        if not 0 <= value <= REGISTER_VALUE_MAX:
+            self.__check_range(_RangeKind.REGISTER_VALUE, value)
         _LOGGER.debug("Write %d to register %d", value, reg)
-        if not SIMULATE:
-            self.__bus.write_byte_data(self.__address, reg, value)
+        self.__bus.write_byte_data(self.__address, reg, value)
+        if reg == Registers.MODE_1:
+            # The device clears RESTART by itself once the restart is done
+            self.__mode_1 = value & ~(1 << Mode1.RESTART)
+
+    def write_block(self, reg: int, values: list[int]) -> None:
+        """
+        Write consecutive registers in one transaction, using auto-increment.
+
+        :param reg: the first register number
+        :param values: byte values, at most 32
+        """
+        _LOGGER.debug("Write %s to registers from %d", values, reg)
+        self.__bus.write_i2c_block_data(self.__address, reg, values)
 
     def read(self, reg: int) -> int:
         """
@@ -264,10 +393,16 @@ class PCA9685Driver:
 
         :param reg: the register number (0-69, 250-255)
         """
-        if SIMULATE:
-            return 0
         return self.__bus.read_byte_data(self.__address, reg)
 
+    def read_block(self, reg: int, length: int) -> list[int]:
+        """
+        Read consecutive registers in one transaction, using auto-increment.
+
+        :param reg: the first register number
+        :param length: number of bytes to read, at most 32
+        """
+        return self.__bus.read_i2c_block_data(self.__address, reg, length)
 
     def calc_pre_scale(self, frequency: int) -> int:
         """
@@ -285,15 +420,46 @@ class PCA9685Driver:
 
         :param value: the frequency in Hz
         """
-        self.__check_range("pwm_frequency", value)
+        self.__check_range(_RangeKind.PWM_FREQUENCY, value)
         reg_val = self.calc_pre_scale(value)
         _LOGGER.debug("Calculated prescale value is %d", reg_val)
         await self._async_i2c_call(self._set_pwm_frequency_sync, reg_val)
+        self.__pwm_frequency = self.calc_frequency(reg_val)
+
+    async def runs_at_pwm_frequency(self, value: int) -> bool:
+        """
+        Return if the device is awake and already runs at the frequency.
+
+        :param value: the frequency in Hz
+        """
+        self.__check_range(_RangeKind.PWM_FREQUENCY, value)
+        reg_val = self.calc_pre_scale(value)
+        if not await self._async_i2c_call(self._runs_at_pre_scale_sync, reg_val):
+            return False
+        self.__pwm_frequency = self.calc_frequency(reg_val)
+        return True
+
+    def _runs_at_pre_scale_sync(self, reg_val: int) -> bool:
+        # SLEEP is set after a power cycle, only set_pwm_frequency clears it
+        if self.mode_1 & (1 << Mode1.SLEEP):
+            return False
+        return self.read(Registers.PRE_SCALE) == reg_val
 
     def _set_pwm_frequency_sync(self, reg_val: int) -> None:
-        self.sleep()
-        self.write(Registers.PRE_SCALE, reg_val)
-        self.wake()
+        self.__check_range(_RangeKind.REGISTER_VALUE, reg_val)
+        _LOGGER.debug("Write prescale %d", reg_val)
+        # PRE_SCALE can only be written while sleeping; send sleep, prescale
+        # and wake as one combined transaction.
+        awake = self.mode_1 & ~((1 << Mode1.RESTART) | (1 << Mode1.SLEEP))
+        asleep = awake | (1 << Mode1.SLEEP)
+        self.__bus.i2c_rdwr(
+            i2c_msg.write(self.__address, [Registers.MODE_1, asleep]),
+            i2c_msg.write(self.__address, [Registers.PRE_SCALE, reg_val]),
+            i2c_msg.write(self.__address, [Registers.MODE_1, awake]),
+        )
+        time.sleep(OSCILLATOR_STARTUP_TIME)
+        # Restart the PWM channels and enable register auto-increment
+        self.write(Registers.MODE_1, awake | (1 << Mode1.RESTART) | (1 << Mode1.AI))
 
     def calc_frequency(self, prescale: int) -> int:
         """
@@ -306,8 +472,12 @@ class PCA9685Driver:
         return round(self.__oscillator_clock / ((prescale + 1) * 4096.0))
 
     async def get_pwm_frequency(self) -> int:
-        """Get the frequency for PWM output."""
-        return await self._async_i2c_call(self._get_pwm_frequency_sync)
+        """Get the frequency for PWM output, only reading the device once."""
+        if self.__pwm_frequency is None:
+            self.__pwm_frequency = await self._async_i2c_call(
+                self._get_pwm_frequency_sync
+            )
+        return self.__pwm_frequency
 
     def _get_pwm_frequency_sync(self) -> int:
         return self.calc_frequency(self.read(Registers.PRE_SCALE))